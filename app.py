@@ -1,9 +1,14 @@
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
 from typing import Dict, Any, List, Tuple
 
+import networkx as nx
 import pandas as pd
 import streamlit as st
-from neo4j import GraphDatabase, basic_auth
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from neo4j import GraphDatabase, Result, RoutingControl, basic_auth
 
 # --- optional interactive graph deps ---
 try:
@@ -14,6 +19,8 @@ try:
 except ImportError:
     PYVIS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 # -----------------------------
 # Neo4j connection helpers
 # -----------------------------
@@ -31,14 +38,241 @@ def get_neo4j_driver():
         )
 
     driver = GraphDatabase.driver(uri, auth=basic_auth(user, password))
+    # Runs once per process (the driver is a cached resource), so the sidebar's
+    # "Connected" status reflects a real handshake rather than a lazy pool.
+    driver.verify_connectivity()
+    # Off the critical path: the first page load doesn't wait for warm-up.
+    Thread(target=warm_query_plans, args=(driver,), name="neo4j-plan-warmup", daemon=True).start()
     return driver
 
 
-def run_cypher(query: str, params: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+# All helpers run inside a managed read transaction (execute_read, or
+# execute_query routed to READ): the driver retries transient failures and
+# routes the work to a reader. Results are fully consumed inside the
+# transaction, as both APIs require.
+
+
+def run_cypher_df(query: str, params: Dict[str, Any] | None = None, driver=None) -> pd.DataFrame:
+    # Result.to_df builds the columns straight from the record stream, and keeps
+    # the RETURN columns even when nothing matched.
+    # execute_query hands the open Result to the transformer, so no session
+    # or transaction function is needed here.
+    driver = driver or get_neo4j_driver()
+    return driver.execute_query(
+        query, params or {}, routing_=RoutingControl.READ, result_transformer_=Result.to_df
+    )
+
+
+def run_cypher_values(query: str, params: Dict[str, Any] | None = None, *keys: str) -> List[Tuple[Any, ...]]:
+    # Plain tuples straight off the result: no per-record dict for queries
+    # whose columns are known up front.
+    driver = get_neo4j_driver()
+    with driver.session() as session:
+        return session.execute_read(lambda tx: tx.run(query, params or {}).values(*keys))
+
+
+def _single_data(tx, query: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    record = tx.run(query, params).single()
+    return record.data() if record else {}
+
+
+def run_cypher_single(query: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    # For queries that return exactly one row: no list of records to build
+    # and index into.
     driver = get_neo4j_driver()
     with driver.session() as session:
-        result = session.run(query, params or {})
-        return [dict(record) for record in result]
+        return session.execute_read(_single_data, query, params or {})
+
+
+# -----------------------------
+# Cypher queries
+# -----------------------------
+
+# Every query is a frozen module-level constant with values passed as
+# $parameters: Neo4j caches compiled plans keyed on the exact query text, so
+# byte-identical Cypher keeps the plan cache warm across reruns.
+#
+# Name filters match the indexed *_lc properties written by
+# backend/add_lowercase_name_properties.py against the lowercased $q; the
+# range index from backend/create_search_indexes.py gives the planner an
+# index-backed option for the min-PubMed filter.
+
+# Bare-label count(*) patterns are answered from Neo4j's counts store
+# (NodeCountFromCountStore / RelationshipCountFromCountStore), not a scan.
+_SUMMARY_COUNTS_CYPHER = """
+CALL {
+  MATCH (:Biomarker) RETURN count(*) AS biomarkers
+}
+CALL {
+  MATCH (:Disease) RETURN count(*) AS diseases
+}
+CALL {
+  MATCH (:Specimen) RETURN count(*) AS specimens
+}
+CALL {
+  MATCH (:DetectionMethod) RETURN count(*) AS methods
+}
+CALL {
+  MATCH (:Device) RETURN count(*) AS devices
+}
+CALL {
+  MATCH ()-[:BIOMARKER_ASSOCIATED_WITH_DISEASE]->() RETURN count(*) AS biomarker_disease_edges
+}
+RETURN biomarkers, diseases, specimens, methods, devices, biomarker_disease_edges
+"""
+
+_LOOKUP_OPTIONS_CYPHER = """
+CALL {
+  MATCH ()-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->()
+  WHERE r.disease_category IS NOT NULL AND r.disease_category <> ''
+  WITH DISTINCT r.disease_category AS cat
+  ORDER BY cat
+  RETURN collect(cat) AS categories
+}
+CALL {
+  MATCH (s:Specimen)
+  WITH s.name AS specimen
+  ORDER BY specimen
+  LIMIT 200
+  RETURN collect(specimen) AS specimens
+}
+RETURN categories, specimens
+"""
+
+_PATH_GRAPH_CYPHER = """
+MATCH (b:Biomarker)-[:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
+WHERE b.name_lc CONTAINS $q OR d.name_lc CONTAINS $q
+// No ranking: the LIMIT stops the seed scan after $max_pairs pairs, and only
+// those pay for the neighbourhood expansion below.
+WITH DISTINCT b, d
+LIMIT $max_pairs
+
+// One row per pair: each neighbour kind is collected into a nested list of
+// [elementId, name] pairs, so b and d are not re-sent for every neighbour
+// and devices carry their own methods.
+RETURN
+  elementId(b) AS b_id, b.name AS b_name,
+  elementId(d) AS d_id, d.name AS d_name,
+  [(b)-[:MEASURED_IN_SPECIMEN]->(s:Specimen) | [elementId(s), s.name]] AS b_specimens,
+  [(d)-[:DETECTED_IN_SPECIMEN]->(s:Specimen) | [elementId(s), s.name]] AS d_specimens,
+  [(dev:Device)-[:INTENDED_FOR]->(d) |
+    [elementId(dev), dev.device_name,
+     [(dev)-[:USES_METHOD]->(m:DetectionMethod) | [elementId(m), m.name]]]] AS devices
+"""
+
+_BD_EDGES_CYPHER = """
+MATCH (b:Biomarker)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
+WHERE
+  (b.name_lc CONTAINS $q OR d.name_lc CONTAINS $q)
+  AND r.pubmed_count >= $min_pubmed
+  AND ($category IS NULL OR r.disease_category = $category)
+// The sort keys are known before expansion, so cut to the top 500 edges
+// first; only those get specimen lookups.
+WITH b, r, d
+ORDER BY r.pubmed_count DESC, b.name, d.name
+LIMIT 500
+// Specimen names are deduped, sorted and joined here so the app can show
+// them as-is; each side is aggregated in its own stage to avoid a bs x ds
+// cross product.
+OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(bs:Specimen)
+WITH b, r, d, bs.name AS bs_name
+ORDER BY bs_name
+WITH b, r, d, [n IN collect(DISTINCT bs_name) WHERE n <> ''] AS bs_names
+OPTIONAL MATCH (d)-[:DETECTED_IN_SPECIMEN]->(ds:Specimen)
+WITH b, r, d, bs_names, ds.name AS ds_name
+ORDER BY ds_name
+WITH b, r, d, bs_names, [n IN collect(DISTINCT ds_name) WHERE n <> ''] AS ds_names
+RETURN
+  b.name AS biomarker,
+  d.name AS disease,
+  r.disease_category AS disease_category,
+  d.is_cancer_like AS disease_is_cancer_like,
+  r.pubmed_count AS pubmed_count,
+  reduce(acc = '', n IN bs_names | acc + CASE acc WHEN '' THEN '' ELSE ', ' END + n) AS biomarker_specimens,
+  reduce(acc = '', n IN ds_names | acc + CASE acc WHEN '' THEN '' ELSE ', ' END + n) AS disease_specimens
+// Aggregation doesn't preserve row order; this re-sorts at most 500 rows.
+ORDER BY pubmed_count DESC, biomarker, disease
+"""
+
+_DISEASE_SPECIMEN_CYPHER = """
+MATCH (d:Disease)-[:DETECTED_IN_SPECIMEN]->(s:Specimen)
+WHERE d.name_lc CONTAINS $q
+RETURN
+  d.name AS disease,
+  s.name AS specimen
+ORDER BY disease, specimen
+LIMIT 300
+"""
+
+_BIOMARKER_SPECIMEN_CYPHER = """
+MATCH (b:Biomarker)-[:MEASURED_IN_SPECIMEN]->(s:Specimen)
+WHERE b.name_lc CONTAINS $q
+RETURN
+  b.name AS biomarker,
+  s.name AS specimen
+ORDER BY biomarker, specimen
+LIMIT 300
+"""
+
+_DEVICES_CYPHER = """
+MATCH (d:Device)
+WHERE
+  d.name_lc CONTAINS $q
+  OR d.product_code_lc CONTAINS $q
+  OR d.k_number_lc CONTAINS $q
+// The first 500 rows by name can only come from the first 500 devices, so
+// only those are expanded into their methods.
+WITH d
+ORDER BY d.device_name
+LIMIT 500
+OPTIONAL MATCH (d)-[:USES_METHOD]->(m:DetectionMethod)
+RETURN
+  d.device_name AS device_name,
+  d.k_number AS k_number,
+  d.product_code AS product_code,
+  m.name AS detection_method
+ORDER BY device_name
+LIMIT 500
+"""
+
+_METHODS_CYPHER = """
+MATCH (m:DetectionMethod)
+WHERE m.name_lc CONTAINS $q
+// A per-method degree count: no OPTIONAL MATCH rows to expand and regroup.
+// USES_METHOD is MERGEd, so each device is counted once.
+RETURN
+  m.name AS detection_method,
+  COUNT { (:Device)-[:USES_METHOD]->(m) } AS num_devices
+ORDER BY num_devices DESC, detection_method
+LIMIT 100
+"""
+
+# A term no name contains: warm-up runs compile and cache the real plans
+# while matching nothing.
+_WARMUP_TERM = "\u0000"
+_WARMUP_QUERIES = (
+    (_PATH_GRAPH_CYPHER, {"q": _WARMUP_TERM, "max_pairs": 1}),
+    (_BD_EDGES_CYPHER, {"q": _WARMUP_TERM, "min_pubmed": 0, "category": None}),
+    (_DISEASE_SPECIMEN_CYPHER, {"q": _WARMUP_TERM}),
+    (_BIOMARKER_SPECIMEN_CYPHER, {"q": _WARMUP_TERM}),
+    (_DEVICES_CYPHER, {"q": _WARMUP_TERM}),
+    (_METHODS_CYPHER, {"q": _WARMUP_TERM}),
+)
+
+
+def warm_query_plans(driver) -> None:
+    """
+    Run each per-search query once so Neo4j has planned it before the first
+    real search. Runs on a background thread; a failure is logged and only
+    costs that first search its planning time.
+    """
+    for cypher, params in _WARMUP_QUERIES:
+        try:
+            driver.execute_query(
+                cypher, params, routing_=RoutingControl.READ, result_transformer_=Result.consume
+            )
+        except Exception:
+            logger.warning("Query plan warm-up failed", exc_info=True)
 
 
 # -----------------------------
@@ -46,43 +280,63 @@ def run_cypher(query: str, params: Dict[str, Any] | None = None) -> List[Dict[st
 # -----------------------------
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=300)
 def get_summary_counts() -> Dict[str, int]:
-    query = """
-    CALL {
-      MATCH (b:Biomarker) RETURN count(b) AS biomarkers
-    }
-    CALL {
-      MATCH (d:Disease) RETURN count(d) AS diseases
-    }
-    CALL {
-      MATCH (s:Specimen) RETURN count(s) AS specimens
-    }
-    CALL {
-      MATCH (m:DetectionMethod) RETURN count(m) AS methods
-    }
-    CALL {
-      MATCH (d:Device) RETURN count(d) AS devices
-    }
-    CALL {
-      MATCH ()-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->() RETURN count(r) AS biomarker_disease_edges
-    }
-    RETURN biomarkers, diseases, specimens, methods, devices, biomarker_disease_edges
+    # All six counts come back in a single row from one round-trip.
+    return run_cypher_single(_SUMMARY_COUNTS_CYPHER)
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def get_lookup_options() -> Tuple[List[str], List[str]]:
+    """
+    Fetch the sidebar disease categories and the reference specimen list in
+    one round-trip.
+
+    Returns:
+      (disease_categories, specimen_names), both sorted.
     """
-    rows = run_cypher(query)
-    return rows[0] if rows else {}
+    rows = run_cypher_values(_LOOKUP_OPTIONS_CYPHER, None, "categories", "specimens")
+    if not rows:
+        return [], []
+    categories, specimens = rows[0]
+    return categories, specimens
 
 
-@st.cache_data(show_spinner=False)
-def get_disease_categories() -> List[str]:
-    query = """
-    MATCH ()-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->()
-    WHERE r.disease_category IS NOT NULL
-    RETURN DISTINCT r.disease_category AS cat
-    ORDER BY cat
+# -----------------------------
+# Tab data
+# -----------------------------
+
+# One worker per tab query so all of them are in flight at once.
+TAB_QUERY_WORKERS = 5
+
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=128)
+def fetch_tab_frames(q_lc: str, min_pubmed: int, category: str | None, _driver=None) -> Dict[str, pd.DataFrame]:
     """
-    rows = run_cypher(query)
-    return [r["cat"] for r in rows if r.get("cat")]
+    Run every tab query for a search and return their result frames, keyed by
+    table name. Cached on the search inputs so repeated searches skip Neo4j;
+    `_driver` is left out of the cache key.
+    """
+    search_params = {"q": q_lc}
+    # One parameterized query for every filter combination: a null
+    # $category disables the category filter inside Cypher.
+    bd_params = {"q": q_lc, "min_pubmed": min_pubmed, "category": category}
+    tab_queries = {
+        "bd_edges": (_BD_EDGES_CYPHER, bd_params),
+        "disease_specimens": (_DISEASE_SPECIMEN_CYPHER, search_params),
+        "biomarker_specimens": (_BIOMARKER_SPECIMEN_CYPHER, search_params),
+        "devices": (_DEVICES_CYPHER, search_params),
+        "methods": (_METHODS_CYPHER, search_params),
+    }
+    # The queries are independent, so overlap their round-trips instead of
+    # paying for them one after another.
+    driver = _driver or get_neo4j_driver()
+    with ThreadPoolExecutor(max_workers=TAB_QUERY_WORKERS) as pool:
+        futures = {
+            name: pool.submit(run_cypher_df, cypher, params, driver)
+            for name, (cypher, params) in tab_queries.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
 
 
 # -----------------------------
@@ -90,97 +344,83 @@ def get_disease_categories() -> List[str]:
 # -----------------------------
 
 
-def get_path_graph_data(q: str, max_pairs: int = 10) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]:
+@st.cache_data(show_spinner=False, ttl=600, max_entries=64)
+def get_path_graph_data(q_lc: str, max_pairs: int = 10) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, str, str]]]:
     """
     Build a node/edge set for a path-style graph centered on biomarker–disease
-    edges that match the search term.
+    edges that match the (already lowercased) search term.
 
     Returns:
       nodes: {id_str: {"label": str, "kind": "Biomarker"/"Disease"/...}}
       edges: [(src_id_str, dst_id_str, rel_type), ...]
     """
-    cypher = """
-    MATCH (b:Biomarker)-[:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
-    WHERE toLower(b.name) CONTAINS $q OR toLower(d.name) CONTAINS $q
-    WITH DISTINCT b, d
-    LIMIT $max_pairs
-
-    OPTIONAL MATCH (b)-[:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d)
-    WITH DISTINCT b, d
-    AS bd, collect({b:b, d:d}) AS bd_pairs
-
-    UNWIND bd_pairs AS pair
-    WITH pair.b AS b, pair.d AS d
-
-    OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(s1:Specimen)
-    OPTIONAL MATCH (d)-[:DETECTED_IN_SPECIMEN]->(s2:Specimen)
-    OPTIONAL MATCH (dev:Device)-[:INTENDED_FOR]->(d)
-    OPTIONAL MATCH (dev)-[:USES_METHOD]->(m:DetectionMethod)
-
-    RETURN
-      id(b) AS b_id, b.name AS b_name,
-      id(d) AS d_id, d.name AS d_name,
-      id(s1) AS s1_id, s1.name AS s1_name,
-      id(s2) AS s2_id, s2.name AS s2_name,
-      id(dev) AS dev_id, dev.device_name AS dev_name,
-      id(m) AS m_id, m.name AS m_name
-    """
+    if not q_lc:
+        return {}, []  # an empty CONTAINS would seed from every edge
 
-    rows = run_cypher(cypher, {"q": q.lower(), "max_pairs": int(max_pairs)})
+    # Records arrive as bare tuples, one per biomarker–disease pair, with
+    # the neighbours already grouped into nested lists.
+    rows = run_cypher_values(_PATH_GRAPH_CYPHER, {"q": q_lc, "max_pairs": int(max_pairs)})
 
+    # elementId() values are already string keys, so the node dict itself is
+    # the only dedupe index and attrs are built once per distinct node.
     nodes: Dict[str, Dict[str, Any]] = {}
     edges_set: set[Tuple[str, str, str]] = set()
 
-    def add_node(node_id, label, kind):
-        if node_id is None or label is None:
-            return
-        nid = str(node_id)
-        if nid not in nodes:
-            nodes[nid] = {"label": label, "kind": kind}
-
-    def add_edge(src_id, dst_id, rel_type):
-        if src_id is None or dst_id is None:
-            return
-        edges_set.add((str(src_id), str(dst_id), rel_type))
-
-    for r in rows:
-        b_id, b_name = r.get("b_id"), r.get("b_name")
-        d_id, d_name = r.get("d_id"), r.get("d_name")
-        s1_id, s1_name = r.get("s1_id"), r.get("s1_name")
-        s2_id, s2_name = r.get("s2_id"), r.get("s2_name")
-        dev_id, dev_name = r.get("dev_id"), r.get("dev_name")
-        m_id, m_name = r.get("m_id"), r.get("m_name")
-
-        # Nodes
-        add_node(b_id, b_name, "Biomarker")
-        add_node(d_id, d_name, "Disease")
-        add_node(s1_id, s1_name, "Specimen")
-        add_node(s2_id, s2_name, "Specimen")
-        add_node(dev_id, dev_name, "Device")
-        add_node(m_id, m_name, "DetectionMethod")
-
-        # Edges
-        add_edge(b_id, d_id, "BIOMARKER_ASSOCIATED_WITH_DISEASE")
-        add_edge(b_id, s1_id, "MEASURED_IN_SPECIMEN")
-        add_edge(d_id, s2_id, "DETECTED_IN_SPECIMEN")
-        add_edge(dev_id, d_id, "INTENDED_FOR")
-        add_edge(dev_id, m_id, "USES_METHOD")
+    def add_node(node_id: str, label: str | None, kind: str) -> bool:
+        if label is None:
+            return False
+        if node_id not in nodes:
+            nodes[node_id] = {"label": label, "kind": kind}
+        return True
+
+    for b_id, b_name, d_id, d_name, b_specimens, d_specimens, devices in rows:
+        has_b = add_node(b_id, b_name, "Biomarker")
+        has_d = add_node(d_id, d_name, "Disease")
+        if has_b and has_d:
+            edges_set.add((b_id, d_id, "BIOMARKER_ASSOCIATED_WITH_DISEASE"))
+        for s_id, s_name in b_specimens:
+            if add_node(s_id, s_name, "Specimen") and has_b:
+                edges_set.add((b_id, s_id, "MEASURED_IN_SPECIMEN"))
+        for s_id, s_name in d_specimens:
+            if add_node(s_id, s_name, "Specimen") and has_d:
+                edges_set.add((d_id, s_id, "DETECTED_IN_SPECIMEN"))
+        for dev_id, dev_name, methods in devices:
+            has_dev = add_node(dev_id, dev_name, "Device")
+            if has_dev and has_d:
+                edges_set.add((dev_id, d_id, "INTENDED_FOR"))
+            for m_id, m_name in methods:
+                if add_node(m_id, m_name, "DetectionMethod") and has_dev:
+                    edges_set.add((dev_id, m_id, "USES_METHOD"))
 
     return nodes, list(edges_set)
 
 
-def render_path_graph(nodes: Dict[str, Dict[str, Any]], edges: List[Tuple[str, str, str]], height: int = 650):
-    if not PYVIS_AVAILABLE:
-        st.error(
-            "pyvis is not installed. Run `pip install pyvis` in your environment "
-            "to enable the interactive graph."
-        )
-        return
+# Graphs above this many nodes are laid out server-side with physics off.
+STATIC_LAYOUT_MIN_NODES = 60
+# spring_layout returns coordinates in [-1, 1]; stretch them to canvas pixels.
+STATIC_LAYOUT_SCALE = 800
 
-    if not nodes:
-        st.warning("No nodes/edges to display for this query.")
-        return
+# Turns the simulation on once the PyVis page has drawn; `network` is the
+# global vis.Network the PyVis template creates.
+_ENABLE_PHYSICS_SCRIPT = (
+    "<script>setTimeout(function () {"
+    " network.setOptions({physics: {enabled: true}}); }, 100);</script>"
+)
 
+
+# Same bounds as the get_path_graph_data cache that feeds it; the rendered
+# pages are far larger than the node/edge data.
+@st.cache_data(show_spinner=False, ttl=600, max_entries=64)
+def build_path_graph_html(
+    nodes: Dict[str, Dict[str, Any]],
+    edges: List[Tuple[str, str, str]],
+    height: int = 650,
+    show_physics_ui: bool = False,
+) -> str:
+    """
+    Render the PyVis page for a node/edge set. Cached on the graph contents so
+    reruns that don't change the graph skip the template render entirely.
+    """
     net = Network(
         height=f"{height}px",
         width="100%",
@@ -189,9 +429,27 @@ def render_path_graph(nodes: Dict[str, Dict[str, Any]], edges: List[Tuple[str, s
         directed=True,
     )
 
-    net.barnes_hut()
-    net.toggle_physics(True)
-    net.show_buttons(filter_=["physics"])
+    # Large graphs get a server-side layout instead of the in-browser force
+    # simulation, whose stabilization time climbs quickly past a few dozen nodes.
+    positions: Dict[str, Any] = {}
+    if len(nodes) > STATIC_LAYOUT_MIN_NODES:
+        g = nx.Graph()
+        g.add_nodes_from(nodes)
+        g.add_edges_from((src, dst) for src, dst, _ in edges)
+        positions = nx.spring_layout(g, k=0.6, iterations=60, seed=42)
+        net.toggle_physics(False)
+        # Cut canvas work on big graphs: straight edges, and none drawn while
+        # the user is panning.
+        net.options.edges.smooth.enabled = False
+        net.toggle_hide_edges_on_drag(True)
+    else:
+        # Paint first with physics off (no up-front stabilization pass), then
+        # let the injected script switch the forceAtlas2 simulation on.
+        net.force_atlas_2based()
+        net.toggle_physics(False)
+        if show_physics_ui:
+            # The configurator adds a sizeable control panel to every page.
+            net.show_buttons(filter_=["physics"])
 
     style_map = {
         "Biomarker": {"color": "#FF7F0E", "shape": "dot"},
@@ -201,22 +459,58 @@ def render_path_graph(nodes: Dict[str, Dict[str, Any]], edges: List[Tuple[str, s
         "DetectionMethod": {"color": "#8C564B", "shape": "triangle"},
     }
 
+    # Nodes are deduped upstream too, so build vis.js node dicts directly
+    # (the keys add_node would produce) instead of add_nodes, which calls
+    # add_node per node and scans the node_ids list each time: O(N^2).
+    net_nodes = []
     for nid, meta in nodes.items():
         label = meta["label"]
         kind = meta.get("kind", "Node")
         style = style_map.get(kind, {"color": "#7F7F7F", "shape": "dot"})
-        net.add_node(
-            nid,
-            label=label,
-            title=f"{kind}: {label}",
-            color=style["color"],
-            shape=style["shape"],
+        node = {
+            "id": nid,
+            "label": label,
+            "title": f"{kind}: {label}",
+            "color": style["color"],
+            "shape": style["shape"],
+            "font": {"color": net.font_color},
+        }
+        if positions:
+            # Physics is already off globally, so fixed x/y is all a node needs.
+            node["x"] = float(positions[nid][0] * STATIC_LAYOUT_SCALE)
+            node["y"] = float(positions[nid][1] * STATIC_LAYOUT_SCALE)
+        net_nodes.append(node)
+    net.nodes = net_nodes
+    net.node_ids = list(nodes)
+
+    # Edges are deduped upstream, so skip add_edge's per-call scan of every
+    # existing edge and hand vis.js the edge list directly.
+    net.edges = [{"from": src, "to": dst, "title": rel, "arrows": "to"} for src, dst, rel in edges]
+
+    html = net.generate_html(notebook=False)
+    if not positions:
+        html = html.replace("</body>", _ENABLE_PHYSICS_SCRIPT + "</body>", 1)
+    return html
+
+
+def render_path_graph(
+    nodes: Dict[str, Dict[str, Any]],
+    edges: List[Tuple[str, str, str]],
+    height: int = 650,
+    show_physics_ui: bool = False,
+):
+    if not PYVIS_AVAILABLE:
+        st.error(
+            "pyvis is not installed. Run `pip install pyvis` in your environment "
+            "to enable the interactive graph."
         )
+        return
 
-    for src, dst, rel in edges:
-        net.add_edge(src, dst, label="", title=rel, arrows="to")
+    if not nodes:
+        st.warning("No nodes/edges to display for this query.")
+        return
 
-    html = net.generate_html(notebook=False)
+    html = build_path_graph_html(nodes, edges, height=height, show_physics_ui=show_physics_ui)
     components.html(html, height=height, scrolling=True)
 
 
@@ -234,7 +528,7 @@ st.title("Biomarker–Disease & Device Knowledge Graph Explorer")
 with st.sidebar:
     st.markdown("### Connection")
     try:
-        driver = get_neo4j_driver()
+        get_neo4j_driver()
         st.success("Connected to Neo4j")
     except Exception as e:
         st.error(f"Neo4j connection error: {e}")
@@ -255,17 +549,31 @@ with st.sidebar:
         step=1,
     )
 
-    disease_category_options = ["(All)"] + get_disease_categories()
+    disease_categories, all_specimens = get_lookup_options()
+    disease_category_options = ["(All)"] + disease_categories
     selected_category = st.selectbox(
         "Disease category filter (for edges)",
         options=disease_category_options,
         index=0,
     )
 
+    show_physics_ui = st.checkbox(
+        "Show graph physics controls",
+        value=False,
+        help="Adds the vis.js physics configurator under small graphs.",
+    )
+
     st.markdown("---")
+    if st.button("Clear cached results"):
+        # Query results are cached for a few minutes; force fresh reads after
+        # importing new data.
+        st.cache_data.clear()
+
     st.caption("This app queries your Aura Neo4j knowledge graph and live FDA 510(k) device data.")
 
 q = search_term.strip()
+# Lowercased once per rerun; every query matches against this form.
+q_lc = q.lower()
 
 summary = get_summary_counts()
 if summary:
@@ -282,6 +590,33 @@ if summary:
         """
     )
 
+# -----------------------------
+# Tab queries (run concurrently, cached)
+# -----------------------------
+# Started before the path graph so the tab round-trips overlap with the
+# graph query and render instead of queueing behind them. The thread carries
+# this script run's context for st.cache_data, and gets the driver from here
+# so it never reaches into st.cache_resource itself.
+tab_result: Dict[str, Any] = {}
+
+
+def _prefetch_tab_frames(driver) -> None:
+    try:
+        tab_result["frames"] = fetch_tab_frames(
+            q_lc,
+            int(min_pubmed),
+            None if selected_category == "(All)" else selected_category,
+            _driver=driver,
+        )
+    except Exception as e:  # re-raised on the script thread below
+        tab_result["error"] = e
+
+
+tab_thread = None
+if q:
+    tab_thread = add_script_run_ctx(Thread(target=_prefetch_tab_frames, args=(get_neo4j_driver(),)))
+    tab_thread.start()
+
 # -----------------------------
 # Global interactive path graph (under summary, above tabs)
 # -----------------------------
@@ -301,24 +636,39 @@ else:
         key="graph_max_pairs",
     )
 
-    nodes, edges = get_path_graph_data(q, max_pairs=max_pairs)
+    nodes, edges = get_path_graph_data(q_lc, max_pairs=max_pairs)
 
     st.caption(
         "Graph nodes include Biomarkers, Diseases, Specimens, Devices, and Detection Methods. "
         "Edges show the relationships between them."
     )
 
-    render_path_graph(nodes, edges, height=650)
+    render_path_graph(nodes, edges, height=650, show_physics_ui=show_physics_ui)
 
     if nodes:
+        # Built from one list per column; pandas stores columns, so there is
+        # no per-row dict to allocate and transpose.
+        node_metas = nodes.values()
         node_df = pd.DataFrame(
-            [{"id": nid, "label": meta["label"], "kind": meta["kind"]} for nid, meta in nodes.items()]
-        ).sort_values("kind")
+            {
+                "id": list(nodes),
+                "label": [meta["label"] for meta in node_metas],
+                # Few distinct kinds: sorting the category codes is cheaper
+                # than comparing strings.
+                "kind": pd.Categorical([meta["kind"] for meta in node_metas]),
+            }
+        ).sort_values("kind", kind="stable")
         with st.expander("Show node list"):
             st.dataframe(node_df, use_container_width=True)
 
 st.markdown("---")
 
+if tab_thread is not None:
+    tab_thread.join()
+    if "error" in tab_result:
+        raise tab_result["error"]
+tab_frames: Dict[str, pd.DataFrame] = tab_result.get("frames", {})
+
 # -----------------------------
 # Tabs (3 only)
 # -----------------------------
@@ -339,50 +689,11 @@ with tabs[0]:
     if not q:
         st.info("Enter a search term in the sidebar and click **Search** to see biomarker–disease edges.")
     else:
-        params = {
-            "q": q.lower(),
-            "min_pubmed": int(min_pubmed),
-        }
+        df = tab_frames["bd_edges"]
 
-        category_filter = ""
-        if selected_category != "(All)":
-            category_filter = "AND r.disease_category = $category"
-            params["category"] = selected_category
-
-        query = f"""
-        MATCH (b:Biomarker)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
-        WHERE
-          (toLower(b.name) CONTAINS $q OR toLower(d.name) CONTAINS $q)
-          AND r.pubmed_count >= $min_pubmed
-          {category_filter}
-        OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(bs:Specimen)
-        OPTIONAL MATCH (d)-[:DETECTED_IN_SPECIMEN]->(ds:Specimen)
-        RETURN
-          b.name AS biomarker,
-          d.name AS disease,
-          r.disease_category AS disease_category,
-          d.is_cancer_like AS disease_is_cancer_like,
-          r.pubmed_count AS pubmed_count,
-          collect(DISTINCT bs.name) AS biomarker_specimens,
-          collect(DISTINCT ds.name) AS disease_specimens
-        ORDER BY pubmed_count DESC, biomarker, disease
-        LIMIT 500
-        """
-        rows = run_cypher(query, params)
-
-        if not rows:
+        if df.empty:
             st.warning("No biomarker–disease edges matched your search/filters.")
         else:
-            df = pd.DataFrame(rows)
-            if "biomarker_specimens" in df.columns:
-                df["biomarker_specimens"] = df["biomarker_specimens"].apply(
-                    lambda xs: ", ".join(sorted({x for x in xs if x})) if isinstance(xs, list) else ""
-                )
-            if "disease_specimens" in df.columns:
-                df["disease_specimens"] = df["disease_specimens"].apply(
-                    lambda xs: ", ".join(sorted({x for x in xs if x})) if isinstance(xs, list) else ""
-                )
-
             st.caption(f"Showing {len(df)} biomarker–disease edges (max 500).")
             st.dataframe(df, use_container_width=True)
 
@@ -396,31 +707,8 @@ with tabs[1]:
     if not q:
         st.info("Enter a search term in the sidebar and click **Search** to explore specimens.")
     else:
-        params = {"q": q.lower()}
-
-        q_disease_specimen = """
-        MATCH (d:Disease)-[:DETECTED_IN_SPECIMEN]->(s:Specimen)
-        WHERE toLower(d.name) CONTAINS $q
-        RETURN
-          d.name AS disease,
-          s.name AS specimen
-        ORDER BY disease, specimen
-        LIMIT 300
-        """
-        disease_rows = run_cypher(q_disease_specimen, params)
-        df_disease = pd.DataFrame(disease_rows)
-
-        q_biomarker_specimen = """
-        MATCH (b:Biomarker)-[:MEASURED_IN_SPECIMEN]->(s:Specimen)
-        WHERE toLower(b.name) CONTAINS $q
-        RETURN
-          b.name AS biomarker,
-          s.name AS specimen
-        ORDER BY biomarker, specimen
-        LIMIT 300
-        """
-        biomarker_rows = run_cypher(q_biomarker_specimen, params)
-        df_biomarker = pd.DataFrame(biomarker_rows)
+        df_disease = tab_frames["disease_specimens"]
+        df_biomarker = tab_frames["biomarker_specimens"]
 
         cols = st.columns(2)
 
@@ -442,11 +730,8 @@ with tabs[1]:
 
     st.markdown("---")
     st.markdown("#### All specimen types (for reference)")
-    all_specimen_rows = run_cypher(
-        "MATCH (s:Specimen) RETURN s.name AS specimen ORDER BY specimen LIMIT 200"
-    )
-    if all_specimen_rows:
-        df_all_spec = pd.DataFrame(all_specimen_rows)
+    if all_specimens:
+        df_all_spec = pd.DataFrame({"specimen": all_specimens})
         st.dataframe(df_all_spec, use_container_width=True, height=260)
     else:
         st.caption("No Specimen nodes found.")
@@ -461,38 +746,8 @@ with tabs[2]:
     if not q:
         st.info("Enter a search term in the sidebar and click **Search** to search devices and methods.")
     else:
-        params = {"q": q.lower()}
-
-        q_devices = """
-        MATCH (d:Device)
-        WHERE
-          toLower(d.device_name) CONTAINS $q
-          OR toLower(coalesce(d.product_code, '')) CONTAINS $q
-          OR toLower(coalesce(d.k_number, '')) CONTAINS $q
-        OPTIONAL MATCH (d)-[:USES_METHOD]->(m:DetectionMethod)
-        RETURN
-          d.device_name AS device_name,
-          d.k_number AS k_number,
-          d.product_code AS product_code,
-          m.name AS detection_method
-        ORDER BY device_name
-        LIMIT 500
-        """
-        device_rows = run_cypher(q_devices, params)
-        df_devices = pd.DataFrame(device_rows)
-
-        q_methods = """
-        MATCH (m:DetectionMethod)
-        WHERE toLower(m.name) CONTAINS $q
-        OPTIONAL MATCH (d:Device)-[:USES_METHOD]->(m)
-        RETURN
-          m.name AS detection_method,
-          count(DISTINCT d) AS num_devices
-        ORDER BY num_devices DESC, detection_method
-        LIMIT 100
-        """
-        method_rows = run_cypher(q_methods, params)
-        df_methods = pd.DataFrame(method_rows)
+        df_devices = tab_frames["devices"]
+        df_methods = tab_frames["methods"]
 
         cols = st.columns(2)
 
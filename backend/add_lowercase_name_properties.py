@@ -0,0 +1,59 @@
+# backend/add_lowercase_name_properties.py
+"""
+Materialize lowercased copies of the searchable name properties and index
+them, so the app can filter with `n.name_lc CONTAINS $q` instead of calling
+toLower() on every node at query time.
+
+The import scripts set these properties themselves whenever they MERGE a
+node; this script backfills nodes created before that, or by any other
+path. Idempotent, so it is safe to re-run.
+"""
+import os
+from neo4j import GraphDatabase
+
+URI = os.getenv("NEO4J_URI")
+USER = os.getenv("NEO4J_USER")
+PASSWORD = os.getenv("NEO4J_PASSWORD")
+
+# (label, source property, lowercase property)
+LOWERCASE_PROPERTIES = [
+    ("Biomarker", "name", "name_lc"),
+    ("Disease", "name", "name_lc"),
+    ("Specimen", "name", "name_lc"),
+    ("DetectionMethod", "name", "name_lc"),
+    ("Device", "device_name", "name_lc"),
+    ("Device", "product_code", "product_code_lc"),
+    ("Device", "k_number", "k_number_lc"),
+]
+
+
+def main():
+    if not URI or not USER or not PASSWORD:
+        raise SystemExit("NEO4J_URI / NEO4J_USER / NEO4J_PASSWORD must be set in the env")
+
+    driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
+
+    with driver.session() as session:
+        for label, src, dst in LOWERCASE_PROPERTIES:
+            print(f"[INFO] Setting {label}.{dst} = toLower({label}.{src}) ...")
+            counters = session.run(
+                f"""
+                MATCH (n:{label})
+                WHERE n.{src} IS NOT NULL
+                SET n.{dst} = toLower(n.{src})
+                """
+            ).consume().counters
+            print(f"[INFO]   properties set: {counters.properties_set}")
+
+            index_name = f"{label.lower()}_{dst}"
+            session.run(
+                f"CREATE TEXT INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.{dst})"
+            ).consume()
+            print(f"[INFO]   text index {index_name} ensured")
+
+    driver.close()
+    print("[INFO] DONE. Lowercase name properties materialized and indexed.")
+
+
+if __name__ == "__main__":
+    main()
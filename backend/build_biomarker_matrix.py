@@ -1,6 +1,8 @@
 import pandas as pd
 from pathlib import Path
 
+from semicolon_lists import join_unique_sorted, split_semicolon_lists
+
 DATA_DIR = Path("data")
 
 def pick_id_and_name(df, label: str):
@@ -36,6 +38,19 @@ def pick_id_and_name(df, label: str):
     return id_col, name_col
 
 
+def map_ids_to_names(id_col: pd.Series, mapping: dict) -> pd.Series:
+    """
+    Turn a column of ';'-separated ids into sorted, de-duplicated "; "-joined
+    names. Ids missing from `mapping` are kept as-is; non-string cells become "".
+
+    Works on the whole column at once (split -> explode -> map -> group)
+    instead of parsing one cell at a time in Python.
+    """
+    ids = split_semicolon_lists(id_col)
+    names = ids.map(mapping).fillna(ids)
+    return join_unique_sorted(names, id_col.index)
+
+
 def main():
     biomarkers = pd.read_csv(DATA_DIR / "biomarkers.csv")
     devices    = pd.read_csv(DATA_DIR / "devices.csv")
@@ -63,25 +78,14 @@ def main():
         if col not in biomatrix.columns:
             biomatrix[col] = ""
 
-    def map_ids_to_names(id_str, mapping):
-        if not isinstance(id_str, str) or not id_str.strip():
-            return ""
-        ids = [x.strip() for x in id_str.split(";") if x.strip()]
-        names = [mapping.get(i, i) for i in ids]
-        return "; ".join(sorted(set(names)))
-
-    biomatrix["devices"]   = biomatrix["device_ids"].apply(
-        lambda s: map_ids_to_names(s, id_to_name["device"])
-    )
-    biomatrix["diseases"]  = biomatrix["disease_ids"].apply(
-        lambda s: map_ids_to_names(s, id_to_name["disease"])
-    )
-    biomatrix["methods"]   = biomatrix["method_ids"].apply(
-        lambda s: map_ids_to_names(s, id_to_name["method"])
-    )
-    biomatrix["specimens"] = biomatrix["specimen_ids"].apply(
-        lambda s: map_ids_to_names(s, id_to_name["specimen"])
-    )
+    # Each linkage column becomes a sorted, de-duplicated "; "-joined name list
+    for ids_col, names_col, kind in [
+        ("device_ids",   "devices",   "device"),
+        ("disease_ids",  "diseases",  "disease"),
+        ("method_ids",   "methods",   "method"),
+        ("specimen_ids", "specimens", "specimen"),
+    ]:
+        biomatrix[names_col] = map_ids_to_names(biomatrix[ids_col], id_to_name[kind])
 
     out_csv = DATA_DIR / "biomarker_matrix.csv"
     biomatrix.to_csv(out_csv, index=False)
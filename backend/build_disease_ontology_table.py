@@ -1,4 +1,5 @@
 import pathlib
+import re
 import requests
 import obonet
 import pandas as pd
@@ -12,6 +13,11 @@ DATA_DIR = pathlib.Path("data")
 DOID_OBO_PATH = DATA_DIR / "doid.obo"
 OUT_CSV = DATA_DIR / "disease_ontology.csv"
 
+# synonym values look like '"foo" EXACT []': the text is the first quoted segment
+SYNONYM_RE = re.compile(r'"([^"]*)')
+# xrefs we keep, e.g. 'MESH:D001943' -> ("MESH", "D001943")
+XREF_RE = re.compile(r"(MESH|UMLS_CUI|ICD10CM):(.*)")
+
 
 def download_doid_obo():
     DATA_DIR.mkdir(exist_ok=True)
@@ -30,7 +36,17 @@ def parse_doid_obo_to_table():
     print(f"[INFO] Parsing {DOID_OBO_PATH} with obonet ...")
     graph = obonet.read_obo(DOID_OBO_PATH)
 
-    rows = []
+    # One list per output column; the frame is built from these directly
+    columns = {
+        "doid": [],
+        "name": [],
+        "synonyms": [],
+        "parent_doids": [],
+        "mesh_ids": [],
+        "umls_ids": [],
+        "icd10_ids": [],
+        "is_cancer_like": [],
+    }
 
     for node_id, data in graph.nodes(data=True):
         # Skip non-DOID nodes, and obsolete terms
@@ -47,13 +63,7 @@ def parse_doid_obo_to_table():
         if isinstance(raw_syns, str):
             raw_syns = [raw_syns]
 
-        def extract_syn_text(s):
-            # naive but works: first quoted segment
-            if '"' in s:
-                return s.split('"')[1]
-            return s
-
-        synonyms = [extract_syn_text(s) for s in raw_syns]
+        synonyms = [m.group(1) if (m := SYNONYM_RE.search(s)) else s for s in raw_syns]
 
         # parent DOIDs from 'is_a'
         parent_ids = data.get("is_a", [])
@@ -65,37 +75,30 @@ def parse_doid_obo_to_table():
         if isinstance(xrefs, str):
             xrefs = [xrefs]
 
-        mesh_ids = []
-        umls_ids = []
-        icd10_ids = []
-
+        xref_ids = {"MESH": [], "UMLS_CUI": [], "ICD10CM": []}
         for x in xrefs:
-            if x.startswith("MESH:"):
-                mesh_ids.append(x.split("MESH:")[1])
-            elif x.startswith("UMLS_CUI:"):
-                umls_ids.append(x.split("UMLS_CUI:")[1])
-            elif x.startswith("ICD10CM:"):
-                icd10_ids.append(x.split("ICD10CM:")[1])
+            m = XREF_RE.match(x)
+            if m:
+                xref_ids[m.group(1)].append(m.group(2))
+        mesh_ids = xref_ids["MESH"]
+        umls_ids = xref_ids["UMLS_CUI"]
+        icd10_ids = xref_ids["ICD10CM"]
 
         # Very rough "is_cancer" tag:
         # check if "cancer" or "carcinoma" appears in name or synonyms
         text_for_flag = " ".join([name] + synonyms).lower()
         is_cancer = int("cancer" in text_for_flag or "carcinoma" in text_for_flag)
 
-        rows.append(
-            {
-                "doid": node_id,
-                "name": name,
-                "synonyms": "; ".join(synonyms),
-                "parent_doids": "; ".join(parent_ids),
-                "mesh_ids": "; ".join(mesh_ids),
-                "umls_ids": "; ".join(umls_ids),
-                "icd10_ids": "; ".join(icd10_ids),
-                "is_cancer_like": is_cancer,
-            }
-        )
-
-    df = pd.DataFrame(rows).sort_values("name").reset_index(drop=True)
+        columns["doid"].append(node_id)
+        columns["name"].append(name)
+        columns["synonyms"].append("; ".join(synonyms))
+        columns["parent_doids"].append("; ".join(parent_ids))
+        columns["mesh_ids"].append("; ".join(mesh_ids))
+        columns["umls_ids"].append("; ".join(umls_ids))
+        columns["icd10_ids"].append("; ".join(icd10_ids))
+        columns["is_cancer_like"].append(is_cancer)
+
+    df = pd.DataFrame(columns).sort_values("name").reset_index(drop=True)
     df.to_csv(OUT_CSV, index=False)
     print(f"[INFO] Wrote {len(df)} rows to {OUT_CSV}")
 
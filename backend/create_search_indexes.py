@@ -0,0 +1,48 @@
+# backend/create_search_indexes.py
+"""
+Create the schema indexes the Streamlit app's search queries rely on.
+
+Idempotent (every statement uses IF NOT EXISTS), so it is safe to re-run.
+The TEXT indexes on the *_lc name properties are created alongside those
+properties by add_lowercase_name_properties.py.
+"""
+import os
+from neo4j import GraphDatabase
+
+URI = os.getenv("NEO4J_URI")
+USER = os.getenv("NEO4J_USER")
+PASSWORD = os.getenv("NEO4J_PASSWORD")
+
+# Labels whose exact `name` is the lookup key for MERGE {name: ...} in the
+# import scripts
+NAME_KEYED_LABELS = ["Biomarker", "Disease", "Specimen", "DetectionMethod"]
+
+INDEX_STATEMENTS = [
+    # Gives the planner a relationship index seek for `r.pubmed_count >= $min_pubmed`
+    """
+    CREATE RANGE INDEX bd_edge_pubmed_count IF NOT EXISTS
+    FOR ()-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]-() ON (r.pubmed_count)
+    """,
+] + [
+    f"CREATE RANGE INDEX {label.lower()}_name IF NOT EXISTS FOR (n:{label}) ON (n.name)"
+    for label in NAME_KEYED_LABELS
+]
+
+
+def main():
+    if not URI or not USER or not PASSWORD:
+        raise SystemExit("NEO4J_URI / NEO4J_USER / NEO4J_PASSWORD must be set in the env")
+
+    driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
+
+    with driver.session() as session:
+        for statement in INDEX_STATEMENTS:
+            print(f"[INFO] {' '.join(statement.split())}")
+            session.run(statement).consume()
+
+    driver.close()
+    print(f"[INFO] DONE. {len(INDEX_STATEMENTS)} search indexes ensured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,7 @@ def store_method_in_neo4j(biomarker, methods):
         for m in methods:
             session.run("""
                 MERGE (meth:DetectionMethod {name: $method})
+                SET meth.name_lc = toLower($method)
                 WITH meth
                 MATCH (b:Biomarker {name: $biomarker})
                 MERGE (b)-[:MEASURED_IN_METHOD]->(meth)
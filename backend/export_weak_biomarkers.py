@@ -1,5 +1,4 @@
 import os
-import pandas as pd
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 
@@ -38,7 +37,8 @@ def fetch_batch(tx, skip, limit):
         x.name           AS target_name
     SKIP $skip LIMIT $limit
     """
-    return list(tx.run(query, skip=skip, limit=limit))
+    # Columns straight off the result stream; no per-record dicts
+    return tx.run(query, skip=skip, limit=limit).to_df()
 
 
 def export_weak():
@@ -58,13 +58,10 @@ def export_weak():
     with driver.session() as session:
         while True:
             # Fetch one page
-            results = session.execute_read(fetch_batch, skip, BATCH_SIZE)
-            if not results:
+            df = session.execute_read(fetch_batch, skip, BATCH_SIZE)
+            if df.empty:
                 break  # no more data
 
-            # Convert Neo4j records -> pandas DataFrame
-            df = pd.DataFrame([r.data() for r in results])
-
             # Append to CSV in chunks to keep memory low
             df.to_csv(
                 OUTPUT_PATH,
@@ -39,6 +39,7 @@ def import_edges(driver, rows):
     MERGE (b:Biomarker {name: $biomarker_name})
       ON CREATE SET
         b.category = $biomarker_category
+    SET b.name_lc = toLower($biomarker_name)
     MERGE (d:Disease {name: $disease_name})
       ON CREATE SET
         d.doid          = $doid,
@@ -47,6 +48,7 @@ def import_edges(driver, rows):
             WHEN $is_cancer_like IS NULL OR $is_cancer_like = '' THEN 0
             ELSE toInteger($is_cancer_like)
         END
+    SET d.name_lc = toLower($disease_name)
     MERGE (b)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d)
       ON CREATE SET
         r.specimen_type = $specimen_type,
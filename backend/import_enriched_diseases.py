@@ -50,6 +50,8 @@ MERGE (d:Disease {name: row.name})
 // SET d += row merges all key/value pairs into d,
 // overwriting existing properties with the new values.
 SET d += row
+// lowercase search key read by the app (see add_lowercase_name_properties.py)
+SET d.name_lc = toLower(row.name)
 """
 
 
@@ -40,7 +40,10 @@ def import_devices(devices):
                 """
                 MERGE (dev:Device {k_number: $k})
                 SET dev.name = $name,
+                    dev.name_lc = toLower($name),
                     dev.product_code = $pcode,
+                    dev.product_code_lc = toLower($pcode),
+                    dev.k_number_lc = toLower($k),
                     dev.specialty = $spec,
                     dev.summary = $sum,
                     dev.date = $dt
@@ -58,6 +61,7 @@ def import_devices(devices):
             session.run(
                 """
                 MERGE (m:DetectionMethod {name: $method})
+                SET m.name_lc = toLower($method)
                 MERGE (dev:Device {k_number: $k})
                 MERGE (dev)-[:USES_METHOD]->(m)
                 """,
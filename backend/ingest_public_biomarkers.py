@@ -199,15 +199,18 @@ def upsert_biomarker(tx, biomarker_name, specimens, diseases, source, aliases):
                     b.aliases = $aliases
       ON MATCH SET  b.specimen_source = coalesce(b.specimen_source, $source),
                     b.aliases = coalesce(b.aliases, $aliases)
+    SET b.name_lc = toLower($name)
 
     WITH b
     UNWIND $specimens AS sp
       MERGE (s:Specimen {name: sp})
+      SET s.name_lc = toLower(sp)
       MERGE (b)-[:MEASURED_IN]->(s)
 
     WITH b
     UNWIND $diseases AS ds
       MERGE (d:Disease {name: ds})
+      SET d.name_lc = toLower(ds)
       MERGE (b)-[:ASSOCIATED_WITH]->(d)
     """
     tx.run(
@@ -15,6 +15,8 @@ of strong + weak targets per biomarker.
 import pandas as pd
 from pathlib import Path
 
+from semicolon_lists import join_unique_sorted, split_semicolon_lists
+
 
 DATA_DIR = Path("data")
 MATRIX_PATH = DATA_DIR / "biomarker_matrix.csv"
@@ -78,28 +80,21 @@ def aggregate_weak_by_label(weak: pd.DataFrame):
     return result
 
 
-def combine_text_lists(strong_val, weak_val):
+def combine_text_columns(strong: pd.Series, weak: pd.Series) -> pd.Series:
     """
-    Combine two semicolon-separated strings into a unique, sorted list.
+    Combine two columns of semicolon-separated strings, row by row, into a
+    unique, sorted list.
 
-    Examples:
+    Examples (per row):
         ("A; B", "B; C") -> "A; B; C"
         ("", "X") -> "X"
         (NaN, "X; Y") -> "X; Y"
-    """
-    items = []
-
-    for val in (strong_val, weak_val):
-        if isinstance(val, str) and val.strip():
-            parts = [p.strip() for p in val.split(";") if p.strip()]
-            items.extend(parts)
 
-    if not items:
-        return ""
-
-    # Unique + sorted for determinism
-    unique_sorted = sorted(set(items))
-    return "; ".join(unique_sorted)
+    Both columns are split, stripped and grouped with pandas string ops in
+    one pass rather than a Python call per row.
+    """
+    items = split_semicolon_lists(pd.concat([strong, weak]))
+    return join_unique_sorted(items, strong.index)
 
 
 def main():
@@ -143,10 +138,7 @@ def main():
 
         # both exist: combine
         print(f"[INFO] Combining '{strong_col}' with '{weak_col}' ...")
-        merged[strong_col] = merged.apply(
-            lambda row: combine_text_lists(row.get(strong_col), row.get(weak_col)),
-            axis=1,
-        )
+        merged[strong_col] = combine_text_columns(merged[strong_col], merged[weak_col])
 
     # Drop *_weak helper columns
     drop_cols = [c for c in merged.columns if c.endswith("_weak")]
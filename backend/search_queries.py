@@ -4,13 +4,85 @@ from typing import List, Dict, Any
 from .neo4j_client import get_driver
 
 
+# --------- Cypher queries --------- #
+# Module-level constants so Neo4j always receives byte-identical query text
+# (its plan cache is keyed on it); all values travel as $parameters.
+# Name filters hit the indexed name_lc properties (see
+# add_lowercase_name_properties.py), so search terms are lowercased here.
+
+SEARCH_BY_DISEASE_CYPHER = """
+MATCH (d:Disease)
+WHERE d.name_lc CONTAINS $term
+OPTIONAL MATCH (b:Biomarker)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d)
+// Keep the top pairs first so only they are expanded into specimens
+WITH d, b, r
+ORDER BY r.pubmed_count DESC
+LIMIT $limit
+OPTIONAL MATCH (d)-[:DETECTED_IN_SPECIMEN]->(ds:Specimen)
+WITH d, b, r, collect(DISTINCT ds.name) AS disease_specimens
+OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(bs:Specimen)
+WITH d, b, r, disease_specimens, collect(DISTINCT bs.name) AS biomarker_specimens
+RETURN
+    d.name AS disease,
+    coalesce(d.category, 'unknown') AS disease_category,
+    b.name AS biomarker,
+    r.pubmed_count AS pubmed_count,
+    disease_specimens,
+    biomarker_specimens
+ORDER BY pubmed_count DESC
+"""
+
+SEARCH_BY_BIOMARKER_CYPHER = """
+MATCH (b:Biomarker)
+WHERE b.name_lc CONTAINS $term
+OPTIONAL MATCH (b)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
+WITH b, d, r
+ORDER BY r.pubmed_count DESC
+LIMIT $limit
+OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(s:Specimen)
+WITH b, d, r, collect(DISTINCT s.name) AS specimens
+RETURN
+    b.name AS biomarker,
+    d.name AS disease,
+    coalesce(d.category, 'unknown') AS disease_category,
+    r.pubmed_count AS pubmed_count,
+    specimens
+ORDER BY pubmed_count DESC
+"""
+
+SEARCH_DEVICES_BY_METHOD_CYPHER = """
+MATCH (d:Device)-[:USES_METHOD]->(m:DetectionMethod)
+WHERE m.name_lc CONTAINS $method
+RETURN
+    d.device_name AS device,
+    d.product_code AS product_code,
+    d.k_number AS k_number,
+    m.name AS method
+LIMIT $limit
+"""
+
+METHODS_SUMMARY_CYPHER = """
+MATCH (d:Device)-[:USES_METHOD]->(m:DetectionMethod)
+RETURN m.name AS method, count(d) AS device_count
+ORDER BY device_count DESC
+"""
+
+
 # --------- Low-level helpers --------- #
 
+def _records_as_dicts(tx, cypher: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Queries return scalars and lists only, so zipping the value tuples with
+    # the keys gives the same rows as record.data() without its per-value walk.
+    result = tx.run(cypher, **params)
+    keys = result.keys()
+    return [dict(zip(keys, values)) for values in result.values()]
+
+
 def _run_read(cypher: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     driver = get_driver()
     with driver.session() as session:
-        result = session.run(cypher, **params)
-        return [record.data() for record in result]
+        # Managed read transaction: retried on transient errors, routed to a reader.
+        return session.execute_read(_records_as_dicts, cypher, params)
 
 
 # --------- High-level search functions --------- #
@@ -20,26 +92,10 @@ def search_by_disease(term: str, limit: int = 50) -> List[Dict[str, Any]]:
     Search diseases by name and return biomarker–disease pairs
     with PubMed counts and specimens.
     """
-    cypher = """
-    MATCH (d:Disease)
-    WHERE toLower(d.name) CONTAINS toLower($term)
-    OPTIONAL MATCH (b:Biomarker)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d)
-    OPTIONAL MATCH (d)-[:DETECTED_IN_SPECIMEN]->(ds:Specimen)
-    OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(bs:Specimen)
-    WITH d, b, r,
-         collect(DISTINCT ds.name) AS disease_specimens,
-         collect(DISTINCT bs.name) AS biomarker_specimens
-    RETURN
-        d.name AS disease,
-        coalesce(d.category, 'unknown') AS disease_category,
-        b.name AS biomarker,
-        r.pubmed_count AS pubmed_count,
-        disease_specimens,
-        biomarker_specimens
-    ORDER BY pubmed_count DESC
-    LIMIT $limit
-    """
-    return _run_read(cypher, {"term": term, "limit": limit})
+    term = term.strip()
+    if not term:
+        return []  # an empty CONTAINS matches every node
+    return _run_read(SEARCH_BY_DISEASE_CYPHER, {"term": term.lower(), "limit": limit})
 
 
 def search_by_biomarker(term: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -47,48 +103,24 @@ def search_by_biomarker(term: str, limit: int = 50) -> List[Dict[str, Any]]:
     Search biomarkers by name and return their associated diseases,
     PubMed counts, and specimens.
     """
-    cypher = """
-    MATCH (b:Biomarker)
-    WHERE toLower(b.name) CONTAINS toLower($term)
-    OPTIONAL MATCH (b)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
-    OPTIONAL MATCH (b)-[:MEASURED_IN_SPECIMEN]->(s:Specimen)
-    WITH b, d, r, collect(DISTINCT s.name) AS specimens
-    RETURN
-        b.name AS biomarker,
-        d.name AS disease,
-        coalesce(d.category, 'unknown') AS disease_category,
-        r.pubmed_count AS pubmed_count,
-        specimens
-    ORDER BY pubmed_count DESC
-    LIMIT $limit
-    """
-    return _run_read(cypher, {"term": term, "limit": limit})
+    term = term.strip()
+    if not term:
+        return []  # an empty CONTAINS matches every node
+    return _run_read(SEARCH_BY_BIOMARKER_CYPHER, {"term": term.lower(), "limit": limit})
 
 
 def search_devices_by_method(method_term: str, limit: int = 100) -> List[Dict[str, Any]]:
     """
     Search devices by detection method (Immunoassay, Biosensor, LAMP, etc.)
     """
-    cypher = """
-    MATCH (d:Device)-[:USES_METHOD]->(m:DetectionMethod)
-    WHERE toLower(m.name) CONTAINS toLower($method)
-    RETURN
-        d.device_name AS device,
-        d.product_code AS product_code,
-        d.k_number AS k_number,
-        m.name AS method
-    LIMIT $limit
-    """
-    return _run_read(cypher, {"method": method_term, "limit": limit})
+    method_term = method_term.strip()
+    if not method_term:
+        return []  # an empty CONTAINS matches every node
+    return _run_read(SEARCH_DEVICES_BY_METHOD_CYPHER, {"method": method_term.lower(), "limit": limit})
 
 
 def search_methods_summary() -> List[Dict[str, Any]]:
     """
     Small helper to see how many devices use each detection method.
     """
-    cypher = """
-    MATCH (d:Device)-[:USES_METHOD]->(m:DetectionMethod)
-    RETURN m.name AS method, count(d) AS device_count
-    ORDER BY device_count DESC
-    """
-    return _run_read(cypher, {})
+    return _run_read(METHODS_SUMMARY_CYPHER, {})
@@ -0,0 +1,32 @@
+# backend/semicolon_lists.py
+import pandas as pd
+
+
+def split_semicolon_lists(col: pd.Series) -> pd.Series:
+    """
+    Explode a column of ';'-separated strings into one stripped item per row,
+    keeping the source row label as the index. Blank and non-string cells
+    contribute nothing.
+    """
+    # The .str accessor rejects columns with no strings at all (e.g. all NaN)
+    if pd.api.types.infer_dtype(col, skipna=True) not in ("string", "mixed", "mixed-integer"):
+        return pd.Series([], dtype=object)
+
+    # .str yields NaN for any non-string cell, which is dropped with the blanks
+    items = col.str.split(";").explode().str.strip()
+    return items[items.notna() & (items != "")]
+
+
+def join_unique_sorted(items: pd.Series, index: pd.Index) -> pd.Series:
+    """
+    Collapse exploded items back to one "; "-joined, de-duplicated, sorted
+    string per row of `index`; rows without items become "".
+    """
+    pairs = pd.DataFrame({"row": items.index, "item": items.to_numpy()})
+    joined = (
+        pairs.drop_duplicates()
+        .sort_values(["row", "item"])
+        .groupby("row")["item"]
+        .agg("; ".join)
+    )
+    return joined.reindex(index, fill_value="")
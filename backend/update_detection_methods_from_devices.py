@@ -42,6 +42,7 @@ def main():
             ELSE 'Analyzer'
           END AS method
         MERGE (m:DetectionMethod {name: method})
+        SET m.name_lc = toLower(method)
         MERGE (d)-[:USES_METHOD]->(m);
         """
 
@@ -20,7 +20,9 @@ def main():
         MATCH (b:Biomarker)-[r:BIOMARKER_ASSOCIATED_WITH_DISEASE]->(d:Disease)
         WITH DISTINCT trim(toLower(coalesce(r.specimen, r.specimen_type))) AS specimen
         WHERE specimen IS NOT NULL AND specimen <> ''
-        MERGE (s:Specimen {name: specimen});
+        MERGE (s:Specimen {name: specimen})
+        // specimen is already trimmed and lowercased above
+        SET s.name_lc = specimen;
         """
 
         summary_nodes = session.run(create_specimens_cypher).consume().counters